@@ -1,10 +1,11 @@
 import os
+import re
 import logging
 import yaml
 import time
 import random
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Pattern
 from cachetools import TTLCache
 
 # Configure logging
@@ -15,6 +16,8 @@ rag_query_cache = TTLCache(maxsize=200, ttl=1800)  # Cache RAG queries for 30 mi
 
 # Global variables
 RESTAURANT_KEYWORDS_BY_LANG = {}
+# Compiled restaurant trigger pattern per language, built from RESTAURANT_KEYWORDS_BY_LANG
+TRIGGER_PATTERNS = {}
 
 # RAG configuration
 import os
@@ -78,6 +81,29 @@ def load_restaurant_keywords(path="app/utils/restaurant_keywords.yaml") -> Dict[
         logger.error(f"❌ Failed to load restaurant keywords: {e}")
         return {}
 
+def build_trigger_patterns(keywords_by_lang: Dict[str, List[str]]) -> Dict[str, Pattern]:
+    """
+    Compile one regex per language matching the keywords used by no other language.
+
+    Args:
+        keywords_by_lang (Dict[str, List[str]]): Restaurant keywords by language
+
+    Returns:
+        Dict[str, Pattern]: Trigger pattern by language, for languages with unique keywords
+    """
+    owners = {}
+    for lang, keywords in keywords_by_lang.items():
+        for keyword in keywords:
+            owners.setdefault(keyword, set()).add(lang)
+
+    patterns = {}
+    for lang, keywords in keywords_by_lang.items():
+        unique = {keyword for keyword in keywords if owners[keyword] == {lang}}
+        if unique:
+            alternation = "|".join(re.escape(keyword) for keyword in sorted(unique))
+            patterns[lang] = re.compile(alternation)
+    return patterns
+
 def query_places(user_query: str, required_features: Dict[str, bool] = None):
     """
     Query the RAG index for places based on user input and required features.
@@ -278,20 +304,9 @@ def contains_restaurant_trigger(text: str, lang: str = "en") -> bool:
     Returns:
         bool: True if the text contains restaurant-related keywords, False otherwise
     """
-    lowered = text.lower()
-    keywords = RESTAURANT_KEYWORDS_BY_LANG.get(lang, [])
-
-    for keyword in keywords:
-        if keyword in lowered:
-            # Check if this keyword is used in other languages
-            used_in_other_langs = any(
-                keyword in RESTAURANT_KEYWORDS_BY_LANG.get(other_lang, [])
-                for other_lang in RESTAURANT_KEYWORDS_BY_LANG
-                if other_lang != lang
-            )
-            if not used_in_other_langs:
-                return True  # Unique word - trigger restaurant dialog
-    return False  # No unique keywords found
+    # Keywords shared with other languages are left out of the patterns
+    pattern = TRIGGER_PATTERNS.get(lang)
+    return bool(pattern and pattern.search(text.lower()))
 
 def create_rag_response(rag_results: List[Dict[str, Any]]) -> str:
     """
@@ -371,6 +386,8 @@ async def handle_restaurant_dialog(user_input: str, session_id: str = "unknown",
             )
             return {"response": reply}
         except asyncio.TimeoutError:
+            from metrics.inference_metrics import log_timeout
+
             logger.error(f"Restaurant script engine timed out after {timeout} seconds")
             log_timeout("restaurant_script")
             return {"response": "Sorry, the restaurant booking system is taking too long to respond. Please try again later! 🐱"}
@@ -384,3 +401,4 @@ async def handle_restaurant_dialog(user_input: str, session_id: str = "unknown",
 
 # Initialize restaurant keywords
 RESTAURANT_KEYWORDS_BY_LANG = load_restaurant_keywords("app/utils/restaurant_keywords.yaml")
+TRIGGER_PATTERNS = build_trigger_patterns(RESTAURANT_KEYWORDS_BY_LANG)
@@ -3,7 +3,7 @@ import logging
 import pandas as pd
 import random
 import time
-from collections import deque
+from collections import OrderedDict
 from typing import Tuple
 from textblob import TextBlob
 
@@ -17,8 +17,10 @@ DATASET_PATH = os.getenv("DATASET_PATH", os.path.join(BASE_DIR, "ml", "datasets"
 # Global variables
 PROVERBS_DF = None
 # Track recently used proverbs to avoid repetition
-# Store as (proverb_id, sentiment) to track both the proverb and associated sentiment
-RECENTLY_USED_PROVERBS = deque(maxlen=50)  # Stores the last 50 used proverbs
+# Keyed by (proverb_id, sentiment) to track both the proverb and associated sentiment,
+# oldest first, so lookups and evictions don't scan the history
+MAX_RECENT_PROVERBS = 50
+RECENTLY_USED_PROVERBS = OrderedDict()  # Stores the last 50 used proverbs
 
 def load_proverbs_dataset():
     """Load the proverbs dataset once at application startup"""
@@ -89,8 +91,8 @@ def get_proverb_by_sentiment(sentiment: str, user_input: str = "") -> Tuple[str,
 
             # Get list of recently used proverb IDs for this sentiment
             recently_used_ids = [
-                item[0] for item in RECENTLY_USED_PROVERBS
-                if item[1] == sentiment
+                proverb_id for proverb_id, used_sentiment in RECENTLY_USED_PROVERBS
+                if used_sentiment == sentiment
             ]
 
             # Create a pool of proverbs, preferring those not recently used
@@ -109,7 +111,11 @@ def get_proverb_by_sentiment(sentiment: str, user_input: str = "") -> Tuple[str,
 
             # Track this proverb as recently used
             proverb_id = selected_row['id']
-            RECENTLY_USED_PROVERBS.append((proverb_id, sentiment))
+            used_key = (proverb_id, sentiment)
+            RECENTLY_USED_PROVERBS[used_key] = None
+            RECENTLY_USED_PROVERBS.move_to_end(used_key)
+            if len(RECENTLY_USED_PROVERBS) > MAX_RECENT_PROVERBS:
+                RECENTLY_USED_PROVERBS.popitem(last=False)
 
             logger.info(f"Selected proverb (ID: {proverb_id}) for sentiment '{sentiment}': {selected_row[catalan_col]}")
 
@@ -103,12 +103,21 @@ def log_request_info(logger: logging.Logger) -> None:
     Args:
         logger: The logger to use
     """
+    # Skip building the header dict and parsing the body when INFO is disabled
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     if has_request_context():
+        # Copy the headers and drop the auth header instead of lower-casing every key
+        headers = dict(request.headers)
+        headers.pop('Authorization', None)
+        headers.pop('authorization', None)
+
         logger.info(
             "Request: %s %s - Headers: %s - Data: %s",
             request.method,
             request.path,
-            {k: v for k, v in request.headers.items() if k.lower() != 'authorization'},
+            headers,
             request.get_json(silent=True)
         )
 
@@ -120,6 +129,9 @@ def log_response_info(logger: logging.Logger, response: Any) -> None:
         logger: The logger to use
         response: The response object
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     if has_request_context():
         logger.info(
             "Response: %s - Headers: %s",
@@ -6,7 +6,6 @@ including error handling and request ID tracking.
 """
 
 import logging
-import traceback
 from functools import wraps
 from typing import Callable, Dict, Any, Tuple, Optional
 from flask import request, jsonify, Response, g, current_app
@@ -64,13 +63,8 @@ def error_handler(app):
         Returns:
             Response: A JSON response with a generic error message
         """
-        # Log the error with traceback
-        logger.error(
-            "Unhandled exception: %s\n%s",
-            str(error),
-            traceback.format_exc(),
-            exc_info=True
-        )
+        # Log the error with traceback (formatted once by the logging module)
+        logger.error("Unhandled exception: %s", error, exc_info=error)
         
         # Create a generic error response
         response = jsonify({
@@ -108,13 +102,16 @@ def request_id_middleware(app):
         # Set the request ID in the request context
         set_request_id(request_id)
         
-        # Log the request
+        # Log the request without the auth header
+        headers = dict(request.headers)
+        headers.pop('Authorization', None)
+        headers.pop('authorization', None)
         logger.info(
             "Request: %s %s - Client: %s - Headers: %s",
             request.method,
             request.path,
             request.remote_addr,
-            {k: v for k, v in request.headers.items() if k.lower() != 'authorization'}
+            headers
         )
     
     @app.after_request
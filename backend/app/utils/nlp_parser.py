@@ -1,8 +1,12 @@
 import logging
+import re
 from app.main import get_chatgpt_response
 
 logger = logging.getLogger(__name__)
 
+# Matches any digit; used as a cheap "looks like a time" probe
+_DIGIT_RE = re.compile(r"\d")
+
 def extract_time_via_gpt(user_input: str, lang: str = "en") -> str:
     """
     Uses ChatGPT to extract time from the user's input in a restaurant reservation context.
@@ -25,7 +29,7 @@ Only return the time value, no extra explanation.
         logger.info(f"[GPT time extraction] Input: '{user_input}' → GPT returned: '{response}'")
 
         # Basic check for time-like string (very relaxed)
-        if any(char.isdigit() for char in response):
+        if _DIGIT_RE.search(response):
             return response
         return "unknown"
     except Exception as e:
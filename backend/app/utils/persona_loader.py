@@ -1,10 +1,35 @@
 import os
 import logging
+from typing import Dict, List
 
 logger = logging.getLogger(__name__)
 
 SUPPORTED_LANGS = ["en", "es", "fr", "de", "ca", "ru"]
 
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../"))  # go up to project root
+PROMPTS_DIR = os.path.join(BASE_DIR, "prompts")
+
+LANG_PLACEHOLDER = "{{lang}}"
+FALLBACK_PERSONA = "ACT AS A MYSTICAL CAT FROM CADAQUÉS. SPEAK IN POETRY AND RIDDLES. LANGUAGE: ENGLISH."
+
+def _load_template_parts() -> Dict[str, List[str]]:
+    """
+    Read every persona file once and split it around the {{lang}} placeholder,
+    so a request only has to join the parts with the language code.
+    """
+    parts = {}
+    for lang in SUPPORTED_LANGS:
+        file_path = os.path.join(PROMPTS_DIR, f"{lang}.md")
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                parts[lang] = f.read().split(LANG_PLACEHOLDER)
+        except OSError:
+            continue
+    return parts
+
+# Pre-split persona templates, keyed by language
+_TEMPLATE_PARTS = _load_template_parts()
+
 def load_persona_from_file(lang: str) -> str:
     """
     Load the HugDimon system prompt for the specified language from the /prompts folder.
@@ -15,10 +40,16 @@ def load_persona_from_file(lang: str) -> str:
         logger.warning(f"⚠️ Unsupported language '{lang}' — falling back to English.")
         lang = "en"
 
-    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../"))  # go up to project root
-    prompts_dir = os.path.join(base_dir, "prompts")
-    file_path = os.path.join(prompts_dir, f"{lang}.md")
-    fallback_path = os.path.join(prompts_dir, "en.md")
+    parts = _TEMPLATE_PARTS.get(lang)
+    if parts is None and "en" in _TEMPLATE_PARTS:
+        logger.warning(f"⚠️ Persona file not found for '{lang}' — using fallback (en.md).")
+        parts = _TEMPLATE_PARTS["en"]
+    if parts is not None:
+        return lang.join(parts)
+
+    # Templates were not available at import time - read from disk
+    file_path = os.path.join(PROMPTS_DIR, f"{lang}.md")
+    fallback_path = os.path.join(PROMPTS_DIR, "en.md")
 
     # Check if file exists, otherwise fallback
     if not os.path.exists(file_path):
@@ -27,9 +58,9 @@ def load_persona_from_file(lang: str) -> str:
 
     try:
         with open(file_path, encoding="utf-8") as f:
-            content = f.read().replace("{{lang}}", lang)
+            content = f.read().replace(LANG_PLACEHOLDER, lang)
             logger.info(f"✅ Loaded persona file: {file_path}")
             return content
     except Exception as e:
         logger.error(f"❌ Failed to load persona file: {e}")
-        return "ACT AS A MYSTICAL CAT FROM CADAQUÉS. SPEAK IN POETRY AND RIDDLES. LANGUAGE: ENGLISH."
+        return FALLBACK_PERSONA
@@ -1,10 +1,29 @@
-from main import app, initialize_app  # because main.py is in the same folder
+import os
 
 try:
-    initialize_app()
+    # main.py (same folder) builds the app at import time, so a prefork server
+    # such as gunicorn initializes once in the master and workers inherit the
+    # warm state copy-on-write.
+    from main import app
 except Exception as e:
     import sys
     print(f"Failed to initialize app: {e}", file=sys.stderr)
     raise
 
+
+def _reset_process_caches() -> None:
+    """
+    Clear process-local caches in a freshly forked worker.
+
+    Caches that hold live resources must be listed here so workers never
+    share them with the parent process:
+        - services.translation_service.translator_pool (translator HTTP sessions)
+    """
+    from services.translation_service import translator_pool
+
+    translator_pool.clear()
+
+
+os.register_at_fork(after_in_child=_reset_process_caches)
+
 application = app
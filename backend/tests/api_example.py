@@ -1,10 +1,17 @@
 import requests
+from requests.adapters import HTTPAdapter
+
+# Reuse one pooled session so repeated calls skip the TCP handshake
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 url = "http://127.0.0.1:5000/chat"
 data = {"message": "Hola"}
 
 # Ensure it's a POST request
-response = requests.post(url, json=data)
+response = _SESSION.post(url, json=data)
 
 print("Status Code:", response.status_code)
 print("Response JSON:", response.json())
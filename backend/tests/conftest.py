@@ -1,24 +1,60 @@
 import os
 import sys
 import pytest
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 from flask import Flask
 from flask.testing import FlaskClient
 
 # Add the project root to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
 
 # Add the app directory to the Python path
 app_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../app"))
 if app_dir not in sys.path:
     sys.path.insert(0, app_dir)
 
-# Import the app factory
-from backend.app.app_factory import create_app
+def pytest_addoption(parser):
+    """Register the command line options used by the test suite."""
+    parser.addoption(
+        "--no-skipfile",
+        action="store_true",
+        default=False,
+        help="run the tests listed in tests/integration/.skipfile.txt instead of skipping them",
+    )
 
-@pytest.fixture
+# Where the benchmark JSON report is written on CI runs (PERF_CI=1)
+BENCHMARK_JSON_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.benchmarks/result.json"))
+
+def pytest_configure(config):
+    """Write a benchmark JSON report for CI regression tracking when PERF_CI=1."""
+    if os.environ.get("PERF_CI") != "1" or not hasattr(config.option, "benchmark_json"):
+        return
+    if config.option.benchmark_json is None:
+        os.makedirs(os.path.dirname(BENCHMARK_JSON_PATH), exist_ok=True)
+        # pytest-benchmark 5.3 takes --benchmark-json as a path and opens it itself
+        config.option.benchmark_json = Path(BENCHMARK_JSON_PATH)
+
+@pytest.fixture(autouse=True)
+def benchmark_metadata(request):
+    """Attach the Python version and commit SHA to every performance benchmark."""
+    if request.node.get_closest_marker("performance") is None or "benchmark" not in request.fixturenames:
+        return
+    benchmark = request.getfixturevalue("benchmark")
+    benchmark.extra_info.update({
+        "python": sys.version,
+        "commit": os.environ.get("GIT_SHA", ""),
+    })
+
+@pytest.fixture(scope="session")
 def app():
-    """Create and configure a Flask app for testing."""
+    """Create and configure one Flask app for the test session."""
+    # Imported here so tests that never build the app don't pay for loading it
+    from backend.app.app_factory import create_app
+
     # Create the Flask app with testing config
     app = create_app()
     app.config.update({
@@ -26,12 +62,16 @@ def app():
         "DEBUG": False,
     })
 
+    # Benchmarks hit the same endpoints many times from one shared app
+    for limiter in app.extensions.get("limiter", ()):
+        limiter.enabled = False
+
     # Return the app for testing
     yield app
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):
-    """A test client for the app."""
+    """A test client shared by the whole test session."""
     return app.test_client()
 
 @pytest.fixture
@@ -40,65 +80,163 @@ def runner(app):
     return app.test_cli_runner()
 
 # Mock fixtures for external services
+#
+# The mock objects are built once per session and re-installed with monkeypatch
+# for each test that asks for them. Before every use the call history and side
+# effects are cleared and the canned return values are re-applied, so tests can
+# still reconfigure a mock freely without leaking into the next test. Leaf
+# values a test could mutate (completion choices, RAG node text and metadata)
+# are rebuilt the same way.
+
+def _reset(mock):
+    """Clear call history and side effects on a shared mock and its children."""
+    mock.reset_mock(side_effect=True)
+
+@pytest.fixture(scope="session")
+def openai_mocks():
+    """Session-wide OpenAI class, client and completion mocks."""
+    return SimpleNamespace(cls=MagicMock(), client=MagicMock(), completion=MagicMock())
+
 @pytest.fixture
-def mock_openai():
+def mock_openai(openai_mocks, monkeypatch):
     """Mock the OpenAI API client."""
-    with patch("openai.OpenAI") as mock:
-        # Configure the mock to return a predictable response
-        mock_client = MagicMock()
-        mock_completion = MagicMock()
-        mock_completion.choices = [MagicMock(message=MagicMock(content="Mocked OpenAI response"))]
-        mock_client.chat.completions.create.return_value = mock_completion
-        mock.return_value = mock_client
-        yield mock
+    _reset(openai_mocks.cls)
+    _reset(openai_mocks.client)
+    _reset(openai_mocks.completion)
+    # Configure the mock to return a predictable response
+    openai_mocks.completion.choices = [MagicMock(message=MagicMock(content="Mocked OpenAI response"))]
+    openai_mocks.client.chat.completions.create.return_value = openai_mocks.completion
+    openai_mocks.cls.return_value = openai_mocks.client
+    monkeypatch.setattr("openai.OpenAI", openai_mocks.cls)
+    return openai_mocks.cls
+
+class FakeOpenAIClient:
+    """
+    Plain stand-in for an OpenAI client that returns a fixed completion.
+
+    Unlike a MagicMock it records nothing, so benchmarks that call it many
+    times measure the code under test rather than the mock.
+    """
+
+    def __init__(self, content="Mocked OpenAI response"):
+        usage = SimpleNamespace(total_tokens=0, prompt_tokens=0, completion_tokens=0)
+        message = SimpleNamespace(content=content)
+        self._completion = SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        return self._completion
+
+# The ChatGPT service builds its client at import time; the app imports it as
+# `services.*` and the tests as `app.services.*`
+OPENAI_CLIENT_TARGETS = (
+    "app.services.chatgpt_service.openai_client",
+    "services.chatgpt_service.openai_client",
+)
 
 @pytest.fixture
-def mock_translator():
-    """Mock the GoogleTranslator."""
-    with patch("deep_translator.GoogleTranslator") as mock:
-        # Configure the mock to return a predictable response
-        mock_translator = MagicMock()
-        mock_translator.translate.return_value = "Mocked translation"
-        mock.return_value = mock_translator
-        yield mock
+def fake_openai(monkeypatch):
+    """Install a FakeOpenAIClient as the ChatGPT service client for benchmarks."""
+    client = FakeOpenAIClient()
+    monkeypatch.setattr("openai.OpenAI", lambda *args, **kwargs: client)
+    for target in OPENAI_CLIENT_TARGETS:
+        monkeypatch.setattr(target, client)
+    return client
+
+@pytest.fixture(scope="session")
+def translator_mocks():
+    """Session-wide GoogleTranslator class and instance mocks."""
+    return SimpleNamespace(cls=MagicMock(), instance=MagicMock())
+
+# The translation service binds GoogleTranslator at import time, so the
+# mock has to replace that name as well as the deep_translator attribute
+TRANSLATOR_TARGETS = (
+    "deep_translator.GoogleTranslator",
+    "app.services.translation_service.GoogleTranslator",
+    "services.translation_service.GoogleTranslator",
+)
 
 @pytest.fixture
-def mock_rag_query_engine():
+def mock_translator(translator_mocks, monkeypatch):
+    """Mock the GoogleTranslator with the session-wide mocks, reset for each test."""
+    _reset(translator_mocks.cls)
+    _reset(translator_mocks.instance)
+    # Configure the mock to return a predictable response
+    translator_mocks.instance.translate.return_value = "Mocked translation"
+    translator_mocks.cls.return_value = translator_mocks.instance
+    for target in TRANSLATOR_TARGETS:
+        monkeypatch.setattr(target, translator_mocks.cls)
+    return translator_mocks.cls
+
+@pytest.fixture(scope="session")
+def rag_query_engine_mocks():
+    """Session-wide RAG query engine, query response and source node mocks."""
+    return SimpleNamespace(engine=MagicMock(), response=MagicMock(), node=MagicMock())
+
+@pytest.fixture
+def mock_rag_query_engine(rag_query_engine_mocks, monkeypatch):
     """Mock the RAG query engine."""
-    with patch("backend.app.services.restaurant_service.rag_query_engine") as mock:
-        # Configure the mock to return a predictable response
-        mock_response = MagicMock()
-        mock_node = MagicMock()
-        mock_node.node.text = "Mocked RAG text"
-        mock_node.node.metadata = {
-            "name": "Mocked Restaurant",
-            "category": "Mocked Category",
-            "direction": "Mocked Direction",
-            "has_booking": True,
-            "email": "mock@example.com",
-            "features": {
-                "has_terrace": True,
-                "sea_view": True
-            }
+    _reset(rag_query_engine_mocks.engine)
+    _reset(rag_query_engine_mocks.response)
+    _reset(rag_query_engine_mocks.node)
+    # Configure the mock to return a predictable response
+    mock_node = rag_query_engine_mocks.node
+    mock_node.node.text = "Mocked RAG text"
+    mock_node.node.metadata = {
+        "name": "Mocked Restaurant",
+        "category": "Mocked Category",
+        "direction": "Mocked Direction",
+        "has_booking": True,
+        "email": "mock@example.com",
+        "features": {
+            "has_terrace": True,
+            "sea_view": True
         }
-        mock_response.source_nodes = [mock_node]
-        mock.query.return_value = mock_response
-        yield mock
+    }
+    rag_query_engine_mocks.response.source_nodes = [mock_node]
+    rag_query_engine_mocks.engine.query.return_value = rag_query_engine_mocks.response
+    monkeypatch.setattr("backend.app.services.restaurant_service.rag_query_engine", rag_query_engine_mocks.engine)
+    return rag_query_engine_mocks.engine
+
+@pytest.fixture(scope="session")
+def sentiment_analyzer_mocks():
+    """Session-wide TextBlob class and blob mocks."""
+    return SimpleNamespace(cls=MagicMock(), blob=MagicMock())
 
 @pytest.fixture
-def mock_sentiment_analyzer():
+def mock_sentiment_analyzer(sentiment_analyzer_mocks, monkeypatch):
     """Mock the sentiment analyzer."""
-    with patch("textblob.TextBlob") as mock:
-        # Configure the mock to return a predictable response
-        mock_blob = MagicMock()
-        mock_blob.sentiment.polarity = 0.5  # Positive sentiment
-        mock.return_value = mock_blob
-        yield mock
+    _reset(sentiment_analyzer_mocks.cls)
+    _reset(sentiment_analyzer_mocks.blob)
+    # Configure the mock to return a predictable response
+    sentiment_analyzer_mocks.blob.sentiment.polarity = 0.5  # Positive sentiment
+    sentiment_analyzer_mocks.cls.return_value = sentiment_analyzer_mocks.blob
+    monkeypatch.setattr("textblob.TextBlob", sentiment_analyzer_mocks.cls)
+    return sentiment_analyzer_mocks.cls
+
+@pytest.fixture(scope="session")
+def language_detector_mock():
+    """Session-wide langdetect.detect mock."""
+    return MagicMock()
 
 @pytest.fixture
-def mock_language_detector():
+def mock_language_detector(language_detector_mock, monkeypatch):
     """Mock the language detector."""
-    with patch("langdetect.detect") as mock:
-        # Configure the mock to return a predictable response
-        mock.return_value = "en"
-        yield mock
+    _reset(language_detector_mock)
+    # Configure the mock to return a predictable response
+    language_detector_mock.return_value = "en"
+    monkeypatch.setattr("langdetect.detect", language_detector_mock)
+    return language_detector_mock
+
+@pytest.fixture(scope="session")
+def sample_proverbs_df():
+    """A small proverbs DataFrame shared by the sentiment tests; treat it as read-only."""
+    # Imported here so runs that don't need it skip loading pandas
+    import pandas as pd
+
+    return pd.DataFrame({
+        'id': [1, 2, 3],
+        'Catalan Proverb': ['Proverb 1', 'Proverb 2', 'Proverb 3'],
+        'English Translation': ['Translation 1', 'Translation 2', 'Translation 3'],
+        'Sentiment': ['Positive', 'Negative', 'Neutral']
+    })
@@ -0,0 +1,194 @@
+import importlib
+import os
+import orjson
+import pytest
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, create_autospec, patch
+
+# Per-machine list of slow test node ids to skip during local iteration
+SKIPFILE = os.path.join(os.path.dirname(__file__), ".skipfile.txt")
+
+def _load_skipfile():
+    """Read the node ids listed in the skipfile, ignoring blank and comment lines."""
+    try:
+        with open(SKIPFILE, encoding="utf-8") as f:
+            return {line.strip() for line in f if line.strip() and not line.startswith("#")}
+    except OSError:
+        return set()
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Pin all `serial` tests to one xdist worker (used with --dist loadgroup),
+    skip the route benchmarks unless the run was started with --benchmark-only
+    and skip the tests listed in the skipfile unless --no-skipfile is given.
+    """
+    run_benchmarks = config.getoption("benchmark_only", default=False)
+    skip_benchmark = pytest.mark.skip(reason="route benchmarks only run with --benchmark-only")
+
+    skipped_ids = set() if config.getoption("no_skipfile", default=False) else _load_skipfile()
+    skip_listed = pytest.mark.skip(reason="skipfile")
+
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
+
+        benchmark_marker = item.get_closest_marker("benchmark")
+        if benchmark_marker and benchmark_marker.kwargs.get("group") == "routes" and not run_benchmarks:
+            item.add_marker(skip_benchmark)
+
+        if item.nodeid in skipped_ids:
+            item.add_marker(skip_listed)
+
+@pytest.fixture(scope="session")
+def app():
+    """Create and configure one Flask app shared by all integration tests."""
+    # Imported here so collection doesn't load the whole app and its services
+    from backend.app.app_factory import create_app
+
+    app = create_app()
+    app.config.update({
+        "TESTING": True,
+        "DEBUG": False,
+        # Let the app's error handlers answer instead of re-raising into the test
+        "PROPAGATE_EXCEPTIONS": False,
+        "TRAP_HTTP_EXCEPTIONS": False,
+    })
+
+    # The shared app would otherwise carry rate-limit counters across tests
+    for limiter in app.extensions.get("limiter", ()):
+        limiter.enabled = False
+
+    yield app
+
+@pytest.fixture(scope="session")
+def client(app):
+    """
+    A test client shared by all integration tests.
+
+    The app context stays pushed for the whole session, so requests reuse it
+    instead of pushing and popping one each time. Per-request state on `g`
+    (the request id) is overwritten by the before_request hook.
+    """
+    with app.test_client() as c, app.app_context():
+        yield c
+
+@pytest.fixture
+def isolated_client(app):
+    """A fresh test client for tests that patch module-level state."""
+    return app.test_client()
+
+def body(response):
+    """Decode a response body with orjson, caching the result on the response."""
+    if not hasattr(response, "_parsed"):
+        response._parsed = orjson.loads(response.data)
+    return response._parsed
+
+@pytest.fixture(name="body")
+def body_fixture():
+    """The memoizing `body(response)` JSON decoder."""
+    return body
+
+# Route dependencies whose calls the integration tests assert on
+ROUTE_MOCK_TARGETS = {
+    "log_rag_feedback": "backend.app.routes.feedback_routes.log_rag_feedback",
+}
+
+# Names patched on the metrics routes module
+METRICS_PATCH_TARGETS = (
+    "get_metrics_snapshot",
+    "get_session_snapshot",
+    "response_cache",
+    "translation_cache",
+    "PROVERBS_DF",
+    "RECENTLY_USED_PROVERBS",
+)
+
+def _resolve(target):
+    """Import the object a dotted target path points to."""
+    module_name, _, attr = target.rpartition(".")
+    return getattr(importlib.import_module(module_name), attr)
+
+@pytest.fixture(scope="session")
+def route_mock_cache():
+    """Autospec'd route mocks, built once per session on first use."""
+    return {}
+
+def _install_route_mock(route_mock_cache, monkeypatch, name):
+    """Install the cached mock for `name` with a clean call history and behaviour."""
+    target = ROUTE_MOCK_TARGETS[name]
+    mock = route_mock_cache.get(name)
+    if mock is None:
+        mock = route_mock_cache[name] = create_autospec(_resolve(target))
+
+    mock.reset_mock()
+    mock.return_value = DEFAULT
+    mock.side_effect = None
+
+    monkeypatch.setattr(target, mock)
+    return mock
+
+@pytest.fixture
+def mock_log_feedback(route_mock_cache, monkeypatch):
+    """Mock the RAG feedback logger used by the feedback routes."""
+    return _install_route_mock(route_mock_cache, monkeypatch, "log_rag_feedback")
+
+@pytest.fixture(scope="module")
+def metrics_patches():
+    """Patch the metrics routes dependencies once per test module."""
+    with ExitStack() as stack:
+        yield SimpleNamespace(**{
+            name: stack.enter_context(patch(f"backend.app.routes.metrics_routes.{name}"))
+            for name in METRICS_PATCH_TARGETS
+        })
+
+# Values reported by the mocked GPT/RAG/translation and session metrics sources
+METRICS_SNAPSHOT = {
+    "gpt_requests_total": 100,
+    "gpt_tokens_total": 5000,
+    "rag_queries_total": 50,
+    "translation_requests_total": 200,
+}
+SESSION_SNAPSHOT = {
+    "active_sessions": 10,
+    "total_sessions": 100,
+    "avg_messages_per_session": 5.5,
+}
+
+@pytest.fixture(params=[True, False], ids=["proverbs_loaded", "no_proverbs"])
+def metrics_mocks(request, metrics_patches):
+    """
+    The shared metrics route mocks, configured with or without loaded proverbs.
+
+    Call history is cleared and every value is re-applied for each test. The
+    returned namespace holds the mocks under `patches`, whether proverbs are
+    loaded and the full `/metrics` payload the route should return.
+    """
+    proverbs_loaded = request.param
+    proverb_count = 100 if proverbs_loaded else 0
+    recent_proverbs = 15 if proverbs_loaded else 0
+
+    for mock in vars(metrics_patches).values():
+        mock.reset_mock(side_effect=True)
+
+    metrics_patches.get_metrics_snapshot.return_value = dict(METRICS_SNAPSHOT)
+    metrics_patches.get_session_snapshot.return_value = dict(SESSION_SNAPSHOT)
+    metrics_patches.response_cache.__len__.return_value = 20
+    metrics_patches.translation_cache.__len__.return_value = 30
+    metrics_patches.PROVERBS_DF.__bool__.return_value = proverbs_loaded
+    metrics_patches.PROVERBS_DF.__len__.return_value = proverb_count
+    metrics_patches.RECENTLY_USED_PROVERBS.__len__.return_value = recent_proverbs
+
+    return SimpleNamespace(
+        patches=metrics_patches,
+        proverbs_loaded=proverbs_loaded,
+        expected={
+            **METRICS_SNAPSHOT,
+            **SESSION_SNAPSHOT,
+            "response_cache_size": 20,
+            "translation_cache_size": 30,
+            "proverbs_loaded": proverbs_loaded,
+            "proverb_count": proverb_count,
+            "recent_proverbs_tracked": recent_proverbs,
+        },
+    )
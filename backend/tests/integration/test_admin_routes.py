@@ -1,5 +1,4 @@
 import pytest
-import json
 from unittest.mock import patch, MagicMock
 
 @pytest.mark.integration
@@ -15,7 +14,7 @@ class TestAdminRoutes:
     @patch('backend.app.routes.admin_routes.SentenceSplitter')
     def test_refresh_rag_index_success(self, mock_splitter, mock_retriever_class, mock_engine_class, 
                                       mock_storage_context, mock_load_index, mock_cache, mock_refresh_index, 
-                                      client, monkeypatch):
+                                      client, monkeypatch, body):
         """Test the refresh RAG index endpoint with successful refresh and reload."""
         # Mock the environment variable for admin token
         monkeypatch.setenv("ADMIN_TOKEN", "test-admin-token")
@@ -45,11 +44,11 @@ class TestAdminRoutes:
         
         # Verify the response
         assert response.status_code == 200
-        assert "status" in response.json
-        assert response.json["status"] == "success"
-        assert "message" in response.json
-        assert "RAG index refreshed and query engine reloaded successfully" in response.json["message"]
-        assert "timestamp" in response.json
+        assert "status" in body(response)
+        assert body(response)["status"] == "success"
+        assert "message" in body(response)
+        assert "RAG index refreshed and query engine reloaded successfully" in body(response)["message"]
+        assert "timestamp" in body(response)
         
         # Verify that the refresh_index function was called
         mock_refresh_index.assert_called_once()
@@ -65,7 +64,7 @@ class TestAdminRoutes:
         mock_retriever_class.assert_called_once()
         mock_engine_class.from_args.assert_called_once()
 
-    def test_refresh_rag_index_unauthorized(self, client, monkeypatch):
+    def test_refresh_rag_index_unauthorized(self, client, monkeypatch, body):
         """Test the refresh RAG index endpoint with unauthorized access."""
         # Mock the environment variable for admin token
         monkeypatch.setenv("ADMIN_TOKEN", "test-admin-token")
@@ -75,19 +74,19 @@ class TestAdminRoutes:
         
         # Verify the response
         assert response.status_code == 401
-        assert "error" in response.json
-        assert response.json["error"] == "Unauthorized access"
+        assert "error" in body(response)
+        assert body(response)["error"] == "Unauthorized access"
         
         # Send the request with incorrect authorization header
         response = client.post("/admin/refresh-rag", headers={"Authorization": "Bearer wrong-token"})
         
         # Verify the response
         assert response.status_code == 401
-        assert "error" in response.json
-        assert response.json["error"] == "Unauthorized access"
+        assert "error" in body(response)
+        assert body(response)["error"] == "Unauthorized access"
 
     @patch('backend.app.routes.admin_routes.refresh_index')
-    def test_refresh_rag_index_refresh_failure(self, mock_refresh_index, client, monkeypatch):
+    def test_refresh_rag_index_refresh_failure(self, mock_refresh_index, client, monkeypatch, body):
         """Test the refresh RAG index endpoint with refresh failure."""
         # Mock the environment variable for admin token
         monkeypatch.setenv("ADMIN_TOKEN", "test-admin-token")
@@ -100,11 +99,11 @@ class TestAdminRoutes:
         
         # Verify the response
         assert response.status_code == 500
-        assert "status" in response.json
-        assert response.json["status"] == "error"
-        assert "message" in response.json
-        assert "Failed to refresh RAG index" in response.json["message"]
-        assert "timestamp" in response.json
+        assert "status" in body(response)
+        assert body(response)["status"] == "error"
+        assert "message" in body(response)
+        assert "Failed to refresh RAG index" in body(response)["message"]
+        assert "timestamp" in body(response)
         
         # Verify that the refresh_index function was called
         mock_refresh_index.assert_called_once()
@@ -113,7 +112,7 @@ class TestAdminRoutes:
     @patch('backend.app.routes.admin_routes.rag_query_cache')
     @patch('backend.app.routes.admin_routes.load_index_from_storage')
     def test_refresh_rag_index_reload_failure(self, mock_load_index, mock_cache, mock_refresh_index, 
-                                             client, monkeypatch):
+                                             client, monkeypatch, body):
         """Test the refresh RAG index endpoint with reload failure."""
         # Mock the environment variable for admin token
         monkeypatch.setenv("ADMIN_TOKEN", "test-admin-token")
@@ -132,13 +131,13 @@ class TestAdminRoutes:
         
         # Verify the response
         assert response.status_code == 500
-        assert "status" in response.json
-        assert response.json["status"] == "partial_success"
-        assert "message" in response.json
-        assert "RAG index refreshed but query engine reload failed" in response.json["message"]
-        assert "error" in response.json
-        assert "Test reload error" in response.json["error"]
-        assert "timestamp" in response.json
+        assert "status" in body(response)
+        assert body(response)["status"] == "partial_success"
+        assert "message" in body(response)
+        assert "RAG index refreshed but query engine reload failed" in body(response)["message"]
+        assert "error" in body(response)
+        assert "Test reload error" in body(response)["error"]
+        assert "timestamp" in body(response)
         
         # Verify that the refresh_index function was called
         mock_refresh_index.assert_called_once()
@@ -150,7 +149,7 @@ class TestAdminRoutes:
         mock_load_index.assert_called_once()
 
     @patch('backend.app.routes.admin_routes.refresh_index', side_effect=ImportError("Test import error"))
-    def test_refresh_rag_index_import_error(self, mock_refresh_index, client, monkeypatch):
+    def test_refresh_rag_index_import_error(self, mock_refresh_index, client, monkeypatch, body):
         """Test the refresh RAG index endpoint with import error."""
         # Mock the environment variable for admin token
         monkeypatch.setenv("ADMIN_TOKEN", "test-admin-token")
@@ -160,16 +159,16 @@ class TestAdminRoutes:
         
         # Verify the response
         assert response.status_code == 500
-        assert "error" in response.json
-        assert response.json["error"] == "RAG module not available"
-        assert "message" in response.json
-        assert "The RAG ingest module could not be imported" in response.json["message"]
+        assert "error" in body(response)
+        assert body(response)["error"] == "RAG module not available"
+        assert "message" in body(response)
+        assert "The RAG ingest module could not be imported" in body(response)["message"]
         
         # Verify that the refresh_index function was called
         mock_refresh_index.assert_called_once()
 
     @patch('backend.app.routes.admin_routes.refresh_index', side_effect=Exception("Test general error"))
-    def test_refresh_rag_index_general_error(self, mock_refresh_index, client, monkeypatch):
+    def test_refresh_rag_index_general_error(self, mock_refresh_index, client, monkeypatch, body):
         """Test the refresh RAG index endpoint with general error."""
         # Mock the environment variable for admin token
         monkeypatch.setenv("ADMIN_TOKEN", "test-admin-token")
@@ -179,10 +178,10 @@ class TestAdminRoutes:
         
         # Verify the response
         assert response.status_code == 500
-        assert "error" in response.json
-        assert response.json["error"] == "Internal server error"
-        assert "message" in response.json
-        assert "Test general error" in response.json["message"]
+        assert "error" in body(response)
+        assert body(response)["error"] == "Internal server error"
+        assert "message" in body(response)
+        assert "Test general error" in body(response)["message"]
         
         # Verify that the refresh_index function was called
         mock_refresh_index.assert_called_once()
\ No newline at end of file
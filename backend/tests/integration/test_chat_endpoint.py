@@ -1,33 +1,38 @@
 import pytest
-import json
-from flask import Flask
+
+_HELLO_PAYLOAD = {"message": "Hello", "session_id": "test_session"}
+
+async def _restaurant_dialog_stub(*_args, **_kwargs):
+    return {"response": "Restaurant response"}
+
+@pytest.fixture
+def restaurant_trigger_stubs():
+    """Make every message trigger the restaurant dialog, which returns a canned response."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.services.restaurant_service.contains_restaurant_trigger", lambda *_args: True)
+        mp.setattr("app.services.restaurant_service.handle_restaurant_dialog", _restaurant_dialog_stub)
+        yield
 
 @pytest.mark.integration
 class TestChatEndpoint:
     """Integration tests for the chat endpoint."""
 
-    def test_chat_endpoint_basic(self, client, mock_openai, mock_sentiment_analyzer, mock_language_detector):
+    def test_chat_endpoint_basic(self, client, mock_openai, mock_sentiment_analyzer, mock_language_detector, body):
         """Test the chat endpoint with basic functionality."""
-        # Prepare the request data
-        data = {
-            "message": "Hello",
-            "session_id": "test_session"
-        }
-        
         # Send the request
-        response = client.post("/chat", json=data)
+        response = client.post("/chat", json=_HELLO_PAYLOAD)
         
         # Verify the response
         assert response.status_code == 200
-        assert "response" in response.json
+        assert "response" in body(response)
         
         # Verify the response contains expected elements
-        response_text = response.json["response"]
+        response_text = body(response)["response"]
         assert "Mocked OpenAI response" in response_text
         assert "Catalan proverb" in response_text
         assert "Translation" in response_text
 
-    def test_chat_endpoint_with_detected_language(self, client, mock_openai, mock_sentiment_analyzer):
+    def test_chat_endpoint_with_detected_language(self, client, mock_openai, mock_sentiment_analyzer, body):
         """Test the chat endpoint with a pre-detected language."""
         # Prepare the request data
         data = {
@@ -41,15 +46,15 @@ class TestChatEndpoint:
         
         # Verify the response
         assert response.status_code == 200
-        assert "response" in response.json
+        assert "response" in body(response)
         
         # Verify the response contains expected elements
-        response_text = response.json["response"]
+        response_text = body(response)["response"]
         assert "Mocked OpenAI response" in response_text
         assert "Catalan proverb" in response_text
         assert "Traducción" in response_text  # Spanish translation label
 
-    def test_chat_endpoint_with_feedback(self, client, mock_openai, mock_sentiment_analyzer, mock_language_detector):
+    def test_chat_endpoint_with_feedback(self, client, mock_openai, mock_sentiment_analyzer, mock_language_detector, body):
         """Test the chat endpoint with feedback data."""
         # Prepare the request data with feedback
         data = {
@@ -69,60 +74,26 @@ class TestChatEndpoint:
         
         # Verify the response
         assert response.status_code == 200
-        assert "response" in response.json
+        assert "response" in body(response)
 
-    def test_chat_endpoint_empty_message(self, client):
-        """Test the chat endpoint with an empty message."""
-        # Prepare the request data
-        data = {
-            "message": "",
-            "session_id": "test_session"
-        }
-        
+    @pytest.mark.parametrize("request_kwargs", [
+        {"json": {"message": "", "session_id": "test_session"}},
+        {"data": "not json", "content_type": "application/json"},
+        {"json": {"session_id": "test_session"}},
+    ], ids=["empty_message", "invalid_json", "missing_message"])
+    def test_chat_endpoint_bad_request(self, client, body, request_kwargs):
+        """Test the chat endpoint with an empty message, invalid JSON or a missing message field."""
         # Send the request
-        response = client.post("/chat", json=data)
-        
-        # Verify the response
-        assert response.status_code == 400
-        assert "error" in response.json
-        assert "message" in response.json
+        response = client.post("/chat", **request_kwargs)
 
-    def test_chat_endpoint_invalid_json(self, client):
-        """Test the chat endpoint with invalid JSON."""
-        # Send the request with invalid JSON
-        response = client.post("/chat", data="not json", content_type="application/json")
-        
         # Verify the response
         assert response.status_code == 400
-        assert "error" in response.json
-        assert "message" in response.json
+        assert "error" in body(response)
+        assert "message" in body(response)
 
-    def test_chat_endpoint_missing_message(self, client):
-        """Test the chat endpoint with missing message field."""
-        # Prepare the request data
-        data = {
-            "session_id": "test_session"
-        }
-        
-        # Send the request
-        response = client.post("/chat", json=data)
-        
-        # Verify the response
-        assert response.status_code == 400
-        assert "error" in response.json
-        assert "message" in response.json
-
-    def test_chat_endpoint_restaurant_trigger(self, client, mock_language_detector, mocker):
+    @pytest.mark.serial
+    def test_chat_endpoint_restaurant_trigger(self, isolated_client, mock_language_detector, restaurant_trigger_stubs, body):
         """Test the chat endpoint with a restaurant trigger."""
-        # Mock the restaurant trigger detection
-        mocker.patch("app.services.restaurant_service.contains_restaurant_trigger", return_value=True)
-        
-        # Mock the restaurant dialog handler
-        mocker.patch(
-            "app.services.restaurant_service.handle_restaurant_dialog",
-            return_value={"response": "Restaurant response"}
-        )
-        
         # Prepare the request data
         data = {
             "message": "I want to book a restaurant",
@@ -130,25 +101,32 @@ class TestChatEndpoint:
         }
         
         # Send the request
-        response = client.post("/chat", json=data)
+        response = isolated_client.post("/chat", json=data)
         
         # Verify the response
         assert response.status_code == 200
-        assert "response" in response.json
-        assert response.json["response"] == "Restaurant response"
+        assert "response" in body(response)
+        assert body(response)["response"] == "Restaurant response"
 
     def test_chat_endpoint_request_id(self, client, mock_openai, mock_sentiment_analyzer, mock_language_detector):
         """Test that the chat endpoint includes a request ID in the response headers."""
-        # Prepare the request data
-        data = {
-            "message": "Hello",
-            "session_id": "test_session"
-        }
-        
         # Send the request with a request ID header
-        response = client.post("/chat", json=data, headers={"X-Request-ID": "test-request-id"})
+        response = client.post("/chat", json=_HELLO_PAYLOAD, headers={"X-Request-ID": "test-request-id"})
         
         # Verify the response
         assert response.status_code == 200
         assert "X-Request-ID" in response.headers
-        assert response.headers["X-Request-ID"] == "test-request-id"
\ No newline at end of file
+        assert response.headers["X-Request-ID"] == "test-request-id"
+
+    @pytest.mark.benchmark(group="routes")
+    def test_chat_endpoint_benchmark(self, benchmark, client, mock_openai, mock_sentiment_analyzer, mock_language_detector):
+        """Benchmark the chat endpoint."""
+        response = benchmark.pedantic(
+            client.post,
+            args=("/chat",),
+            kwargs={"json": _HELLO_PAYLOAD},
+            rounds=200,
+            warmup_rounds=10
+        )
+
+        assert response.status_code == 200
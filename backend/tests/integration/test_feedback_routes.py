@@ -1,13 +1,10 @@
 import pytest
-import json
-from unittest.mock import patch
 
 @pytest.mark.integration
 class TestFeedbackRoutes:
     """Integration tests for the feedback routes."""
 
-    @patch('backend.app.routes.feedback_routes.log_rag_feedback')
-    def test_rag_feedback_success(self, mock_log_feedback, client):
+    def test_rag_feedback_success(self, client, mock_log_feedback, body):
         """Test the RAG feedback endpoint with valid data."""
         # Prepare the request data
         data = {
@@ -21,48 +18,38 @@ class TestFeedbackRoutes:
         
         # Verify the response
         assert response.status_code == 200
-        assert "status" in response.json
-        assert response.json["status"] == "success"
-        assert "message" in response.json
-        assert "Feedback recorded successfully" in response.json["message"]
-        assert "timestamp" in response.json
+        assert "status" in body(response)
+        assert body(response)["status"] == "success"
+        assert "message" in body(response)
+        assert "Feedback recorded successfully" in body(response)["message"]
+        assert "timestamp" in body(response)
         
         # Verify that the log_rag_feedback function was called with the correct arguments
         mock_log_feedback.assert_called_once_with("test-query-id", True, ["result1", "result2"])
 
-    def test_rag_feedback_not_json(self, client):
-        """Test the RAG feedback endpoint with non-JSON data."""
-        # Send the request with non-JSON data
-        response = client.post("/feedback/rag", data="not json", content_type="application/json")
-        
-        # Verify the response
-        assert response.status_code == 400
-        assert "error" in response.json
-        assert response.json["error"] == "Request must be JSON"
-
-    def test_rag_feedback_invalid_json(self, client):
-        """Test the RAG feedback endpoint with invalid JSON."""
-        # Send the request with invalid JSON
-        response = client.post("/feedback/rag", data="{", content_type="application/json")
-        
-        # Verify the response
-        assert response.status_code == 400
-        assert "error" in response.json
-        assert "Invalid JSON" in response.json["error"]
+    @pytest.mark.parametrize("request_kwargs,expected_error,exact", [
+        ({"data": "not json", "content_type": "application/json"}, "Request must be JSON", True),
+        ({"data": "{", "content_type": "application/json"}, "Invalid JSON", False),
+        ({"json": {}}, "Invalid JSON", True),
+    ], ids=["not_json", "invalid_json", "empty_json"])
+    def test_rag_feedback_bad_request(self, client, body, request_kwargs, expected_error, exact):
+        """Test the RAG feedback endpoint with non-JSON data, invalid JSON or empty JSON."""
+        # Send the request
+        response = client.post("/feedback/rag", **request_kwargs)
 
-    def test_rag_feedback_empty_json(self, client):
-        """Test the RAG feedback endpoint with empty JSON."""
-        # Send the request with empty JSON
-        response = client.post("/feedback/rag", json=None)
-        
         # Verify the response
         assert response.status_code == 400
-        assert "error" in response.json
-        assert response.json["error"] == "Invalid JSON"
+        assert "error" in body(response)
+        if exact:
+            assert body(response)["error"] == expected_error
+        else:
+            assert expected_error in body(response)["error"]
 
-    @patch('backend.app.routes.feedback_routes.log_rag_feedback', side_effect=Exception("Test error"))
-    def test_rag_feedback_error(self, mock_log_feedback, client):
+    def test_rag_feedback_error(self, client, mock_log_feedback, body):
         """Test the RAG feedback endpoint when an error occurs."""
+        # Mock log_rag_feedback to raise an exception
+        mock_log_feedback.side_effect = Exception("Test error")
+
         # Prepare the request data
         data = {
             "query_id": "test-query-id",
@@ -75,10 +62,10 @@ class TestFeedbackRoutes:
         
         # Verify the response
         assert response.status_code == 500
-        assert "error" in response.json
-        assert response.json["error"] == "Internal server error"
-        assert "message" in response.json
-        assert "Test error" in response.json["message"]
+        assert "error" in body(response)
+        assert body(response)["error"] == "Internal server error"
+        assert "message" in body(response)
+        assert "Test error" in body(response)["message"]
         
         # Verify that the log_rag_feedback function was called with the correct arguments
         mock_log_feedback.assert_called_once_with("test-query-id", True, ["result1", "result2"])
@@ -1,152 +1,137 @@
+import re
 import pytest
-import json
-from unittest.mock import patch
+
+_CADAQUES_PAYLOAD = {"message": "Tell me about restaurants in Cadaqués"}
+
+# Fragments the guide response renders from the mocked RAG results. The app
+# serializes JSON without ASCII escaping, so they can be matched on the raw body.
+_RAG_NEEDLES = frozenset(text.encode() for text in (
+    "Mocked Restaurant",
+    "Mocked RAG text",
+    "Можно забронировать",
+    "mock@example.com",
+    "У этого места есть терраса",
+    "Здесь открывается вид на море",
+))
+# One alternation finds every needle in a single pass over the body
+_RAG_NEEDLE_RE = re.compile(b"|".join(re.escape(needle) for needle in _RAG_NEEDLES))
+
+# Stand-ins for the guide routes' dependencies in tests that don't check calls
+_GUIDE_ROUTES = "backend.app.routes.guide_routes"
+_RAG_ERR = Exception("Test RAG error")
+_CHATGPT_ERR = Exception("Test ChatGPT error")
+
+def _no_places(*_args, **_kwargs):
+    return []
+
+def _raise_rag(*_args, **_kwargs):
+    raise _RAG_ERR
+
+def _raise_chatgpt(*_args, **_kwargs):
+    raise _CHATGPT_ERR
 
 @pytest.mark.integration
 class TestGuideRoutes:
     """Integration tests for the guide routes."""
 
-    def test_guide_endpoint_with_rag_results(self, client, mock_rag_query_engine):
+    def test_guide_endpoint_with_rag_results(self, client, mock_rag_query_engine, body):
         """Test the guide endpoint when RAG returns results."""
-        # Prepare the request data
-        data = {
-            "message": "Tell me about restaurants in Cadaqués"
-        }
-        
         # Send the request
-        response = client.post("/guide", json=data)
+        response = client.post("/guide", json=_CADAQUES_PAYLOAD)
         
         # Verify the response
         assert response.status_code == 200
-        assert "response" in response.json
+        assert "response" in body(response)
         
         # Verify the response contains expected elements from RAG results
-        response_text = response.json["response"]
-        assert "Mocked Restaurant" in response_text
-        assert "Mocked RAG text" in response_text
-        assert "Можно забронировать" in response_text
-        assert "mock@example.com" in response_text
-        assert "У этого места есть терраса" in response_text
-        assert "Здесь открывается вид на море" in response_text
-
-    @patch('backend.app.routes.guide_routes.query_places')
-    def test_guide_endpoint_with_chatgpt_fallback(self, mock_query_places, client, mock_openai):
+        found = set(_RAG_NEEDLE_RE.findall(response.data))
+        assert found == _RAG_NEEDLES
+
+    def test_guide_endpoint_with_chatgpt_fallback(self, client, mock_openai, body):
         """Test the guide endpoint when RAG returns no results and falls back to ChatGPT."""
-        # Mock query_places to return empty results
-        mock_query_places.return_value = []
-        
-        # Prepare the request data
-        data = {
-            "message": "Tell me about restaurants in Cadaqués"
-        }
-        
-        # Send the request
-        response = client.post("/guide", json=data)
+        with pytest.MonkeyPatch.context() as mp:
+            # Stub query_places to return empty results
+            mp.setattr(f"{_GUIDE_ROUTES}.query_places", _no_places)
+
+            # Send the request
+            response = client.post("/guide", json=_CADAQUES_PAYLOAD)
         
         # Verify the response
         assert response.status_code == 200
-        assert "response" in response.json
+        assert "response" in body(response)
         
         # Verify the response contains expected elements from ChatGPT
-        response_text = response.json["response"]
+        response_text = body(response)["response"]
         assert "Mocked OpenAI response" in response_text
 
-    def test_guide_endpoint_invalid_json(self, client):
-        """Test the guide endpoint with invalid JSON."""
-        # Send the request with invalid JSON
-        response = client.post("/guide", data="not json", content_type="application/json")
-        
-        # Verify the response
-        assert response.status_code == 400
-        assert "error" in response.json
-        assert "message" in response.json
-        assert "Request must be JSON" in response.json["message"]
-
-    def test_guide_endpoint_missing_message(self, client):
-        """Test the guide endpoint with missing message field."""
-        # Prepare the request data
-        data = {}
-        
+    @pytest.mark.parametrize("request_kwargs,expected_message", [
+        ({"data": "not json", "content_type": "application/json"}, "Request must be JSON"),
+        ({"json": {}}, "Missing message field"),
+        ({"json": {"message": ""}}, "Empty message"),
+    ], ids=["invalid_json", "missing_message", "empty_message"])
+    def test_guide_endpoint_bad_request(self, client, body, request_kwargs, expected_message):
+        """Test the guide endpoint with invalid JSON, a missing message field or an empty message."""
         # Send the request
-        response = client.post("/guide", json=data)
-        
-        # Verify the response
-        assert response.status_code == 400
-        assert "error" in response.json
-        assert "message" in response.json
-        assert "Missing message field" in response.json["message"]
-
-    def test_guide_endpoint_empty_message(self, client):
-        """Test the guide endpoint with empty message field."""
-        # Prepare the request data
-        data = {
-            "message": ""
-        }
-        
-        # Send the request
-        response = client.post("/guide", json=data)
-        
+        response = client.post("/guide", **request_kwargs)
+
         # Verify the response
         assert response.status_code == 400
-        assert "error" in response.json
-        assert "message" in response.json
-        assert "Empty message" in response.json["message"]
+        assert "error" in body(response)
+        assert "message" in body(response)
+        assert expected_message in body(response)["message"]
 
-    @patch('backend.app.routes.guide_routes.query_places')
-    def test_guide_endpoint_rag_error(self, mock_query_places, client):
+    def test_guide_endpoint_rag_error(self, client, body):
         """Test the guide endpoint when RAG query raises an error."""
-        # Mock query_places to raise an exception
-        mock_query_places.side_effect = Exception("Test RAG error")
-        
-        # Prepare the request data
-        data = {
-            "message": "Tell me about restaurants in Cadaqués"
-        }
-        
-        # Send the request
-        response = client.post("/guide", json=data)
+        with pytest.MonkeyPatch.context() as mp:
+            # Stub query_places to raise an exception
+            mp.setattr(f"{_GUIDE_ROUTES}.query_places", _raise_rag)
+
+            # Send the request
+            response = client.post("/guide", json=_CADAQUES_PAYLOAD)
         
         # Verify the response
         assert response.status_code == 503
-        assert "error" in response.json
-        assert "message" in response.json
-        assert "Error querying places database" in response.json["message"]
+        assert "error" in body(response)
+        assert "message" in body(response)
+        assert "Error querying places database" in body(response)["message"]
 
-    @patch('backend.app.routes.guide_routes.query_places')
-    @patch('backend.app.routes.guide_routes.get_chatgpt_response')
-    def test_guide_endpoint_chatgpt_error(self, mock_get_chatgpt_response, mock_query_places, client):
+    def test_guide_endpoint_chatgpt_error(self, client, body):
         """Test the guide endpoint when ChatGPT raises an error."""
-        # Mock query_places to return empty results
-        mock_query_places.return_value = []
-        
-        # Mock get_chatgpt_response to raise an exception
-        mock_get_chatgpt_response.side_effect = Exception("Test ChatGPT error")
-        
-        # Prepare the request data
-        data = {
-            "message": "Tell me about restaurants in Cadaqués"
-        }
-        
-        # Send the request
-        response = client.post("/guide", json=data)
+        with pytest.MonkeyPatch.context() as mp:
+            # Stub query_places to return empty results
+            mp.setattr(f"{_GUIDE_ROUTES}.query_places", _no_places)
+
+            # Stub get_chatgpt_response to raise an exception
+            mp.setattr(f"{_GUIDE_ROUTES}.get_chatgpt_response", _raise_chatgpt)
+
+            # Send the request
+            response = client.post("/guide", json=_CADAQUES_PAYLOAD)
         
         # Verify the response
         assert response.status_code == 502
-        assert "error" in response.json
-        assert "message" in response.json
-        assert "Error getting AI response" in response.json["message"]
+        assert "error" in body(response)
+        assert "message" in body(response)
+        assert "Error getting AI response" in body(response)["message"]
 
     def test_guide_endpoint_request_id(self, client, mock_rag_query_engine):
         """Test that the guide endpoint includes a request ID in the response headers."""
-        # Prepare the request data
-        data = {
-            "message": "Tell me about restaurants in Cadaqués"
-        }
-        
         # Send the request with a request ID header
-        response = client.post("/guide", json=data, headers={"X-Request-ID": "test-request-id"})
+        response = client.post("/guide", json=_CADAQUES_PAYLOAD, headers={"X-Request-ID": "test-request-id"})
         
         # Verify the response
         assert response.status_code == 200
         assert "X-Request-ID" in response.headers
-        assert response.headers["X-Request-ID"] == "test-request-id"
\ No newline at end of file
+        assert response.headers["X-Request-ID"] == "test-request-id"
+
+    @pytest.mark.benchmark(group="routes")
+    def test_guide_endpoint_benchmark(self, benchmark, client, mock_rag_query_engine):
+        """Benchmark the guide endpoint."""
+        response = benchmark.pedantic(
+            client.post,
+            args=("/guide",),
+            kwargs={"json": _CADAQUES_PAYLOAD},
+            rounds=200,
+            warmup_rounds=10
+        )
+
+        assert response.status_code == 200
@@ -1,44 +1,47 @@
 import pytest
-import json
+
+# Routes the root endpoint must advertise
+_EXPECTED_ROUTES = frozenset({
+    "/chat",
+    "/guide",
+    "/health",
+    "/metrics",
+    "/feedback/rag",
+    "/admin/refresh-rag",
+})
 
 @pytest.mark.integration
 class TestHealthRoutes:
     """Integration tests for the health routes."""
 
-    def test_health_check(self, client):
+    def test_health_check(self, client, body):
         """Test the health check endpoint."""
         # Send a GET request to the health endpoint
         response = client.get("/health")
         
         # Verify the response
         assert response.status_code == 200
-        assert "status" in response.json
-        assert response.json["status"] == "ok"
-        assert "version" in response.json
-        assert "timestamp" in response.json
+        assert "status" in body(response)
+        assert body(response)["status"] == "ok"
+        assert "version" in body(response)
+        assert "timestamp" in body(response)
         
         # Verify the timestamp is a number
-        assert isinstance(response.json["timestamp"], (int, float))
+        assert isinstance(body(response)["timestamp"], (int, float))
 
-    def test_root_endpoint(self, client):
+    def test_root_endpoint(self, client, body):
         """Test the root endpoint."""
         # Send a GET request to the root endpoint
         response = client.get("/")
         
         # Verify the response
         assert response.status_code == 200
-        assert "message" in response.json
-        assert "Welcome to HugDimon API!" in response.json["message"]
-        assert "status" in response.json
-        assert response.json["status"] == "online"
-        assert "endpoints" in response.json
-        assert "version" in response.json
+        assert "message" in body(response)
+        assert "Welcome to HugDimon API!" in body(response)["message"]
+        assert "status" in body(response)
+        assert body(response)["status"] == "online"
+        assert "endpoints" in body(response)
+        assert "version" in body(response)
         
         # Verify the endpoints information
-        endpoints = response.json["endpoints"]
-        assert "/chat" in endpoints
-        assert "/guide" in endpoints
-        assert "/health" in endpoints
-        assert "/metrics" in endpoints
-        assert "/feedback/rag" in endpoints
-        assert "/admin/refresh-rag" in endpoints
\ No newline at end of file
+        assert _EXPECTED_ROUTES <= body(response)["endpoints"].keys()
\ No newline at end of file
@@ -4,6 +4,64 @@ import asyncio
 
 from app.services.chat_service import ChatService, TRANSLATION_LABELS, SUPPORTED_LANGS
 
+def _returns(value):
+    """Build a plain stub that ignores its arguments and returns `value`."""
+    return lambda *args, **kwargs: value
+
+def _raises(error):
+    """Build a plain stub that ignores its arguments and raises `error`."""
+    def stub(*args, **kwargs):
+        raise error
+    return stub
+
+# process_request_async imports its dependencies at call time, so they are
+# replaced on the modules it imports them from
+CHAT_DEPENDENCIES = {
+    "track_session": "metrics.session_metrics.track_session",
+    "analyze_sentiment": "services.sentiment_service.analyze_sentiment",
+    "get_proverb_by_sentiment": "services.sentiment_service.get_proverb_by_sentiment",
+    "detect_language": "services.language_service.detect_language",
+    "contains_restaurant_trigger": "services.restaurant_service.contains_restaurant_trigger",
+    "handle_restaurant_dialog": "services.restaurant_service.handle_restaurant_dialog",
+    "extract_required_features": "services.restaurant_service.extract_required_features",
+    "query_places": "services.restaurant_service.query_places",
+    "get_chatgpt_response": "services.chatgpt_service.get_chatgpt_response",
+    "translate_text": "services.translation_service.translate_text",
+}
+
+# Default stubs for a plain English, non-restaurant request
+DEFAULT_CHAT_STUBS = {
+    "track_session": _returns(None),
+    "analyze_sentiment": _returns("Positive"),
+    "get_proverb_by_sentiment": _returns(("Catalan proverb", "English translation")),
+    "detect_language": _returns("en"),
+    "contains_restaurant_trigger": _returns(False),
+    "handle_restaurant_dialog": AsyncMock(return_value={"response": "Restaurant response"}),
+    "extract_required_features": _returns({}),
+    "query_places": _returns([]),
+    "get_chatgpt_response": _returns("GPT response"),
+    "translate_text": _returns("Translated text"),
+}
+
+@pytest.fixture
+def chat_deps(request, monkeypatch):
+    """
+    Install the chat service dependency stubs.
+
+    Individual stubs can be replaced per test with
+    `@pytest.mark.chat_deps(name=stub, ...)`. Returns the installed stubs by name.
+    """
+    stubs = dict(DEFAULT_CHAT_STUBS)
+    marker = request.node.get_closest_marker("chat_deps")
+    if marker:
+        stubs.update(marker.kwargs)
+
+    for name, stub in stubs.items():
+        if isinstance(stub, AsyncMock):
+            stub.reset_mock()
+        monkeypatch.setattr(CHAT_DEPENDENCIES[name], stub)
+    return stubs
+
 class TestChatService:
     """Tests for the ChatService class."""
 
@@ -48,20 +106,8 @@ class TestChatService:
         with pytest.raises(ValueError, match="Input must be a string"):
             ChatService.sanitize_input(123)
 
-    @pytest.mark.asyncio
-    async def test_process_request_async_basic(self, mocker):
+    async def test_process_request_async_basic(self, chat_deps):
         """Test the process_request_async method with basic functionality."""
-        # Mock dependencies
-        mocker.patch("app.services.chat_service.track_session")
-        mocker.patch("app.services.chat_service.analyze_sentiment", return_value="Positive")
-        mocker.patch("app.services.chat_service.detect_language", return_value="en")
-        mocker.patch("app.services.chat_service.contains_restaurant_trigger", return_value=False)
-        mocker.patch("app.services.chat_service.extract_required_features", return_value={})
-        mocker.patch("app.services.chat_service.query_places", return_value=[])
-        mocker.patch("app.services.chat_service.get_chatgpt_response", return_value="GPT response")
-        mocker.patch("app.services.chat_service.get_proverb_by_sentiment", 
-                    return_value=("Catalan proverb", "English translation"))
-
         # Call the method
         result = await ChatService.process_request_async("Hello", "test_session")
 
@@ -71,39 +117,19 @@ class TestChatService:
         assert "Catalan proverb" in result["response"]
         assert "English translation" in result["response"]
 
-    @pytest.mark.asyncio
-    async def test_process_request_async_restaurant_trigger(self, mocker):
+    @pytest.mark.chat_deps(contains_restaurant_trigger=_returns(True))
+    async def test_process_request_async_restaurant_trigger(self, chat_deps):
         """Test the process_request_async method with restaurant trigger."""
-        # Mock dependencies
-        mocker.patch("app.services.chat_service.track_session")
-        mocker.patch("app.services.chat_service.analyze_sentiment", return_value="Positive")
-        mocker.patch("app.services.chat_service.detect_language", return_value="en")
-        mocker.patch("app.services.chat_service.contains_restaurant_trigger", return_value=True)
-        
-        # Mock the restaurant dialog handler
-        mock_handle_restaurant = AsyncMock(return_value={"response": "Restaurant response"})
-        mocker.patch("app.services.chat_service.handle_restaurant_dialog", side_effect=mock_handle_restaurant)
-
         # Call the method
         result = await ChatService.process_request_async("I want to book a restaurant", "test_session")
 
         # Verify the result
         assert "response" in result
         assert result["response"] == "Restaurant response"
-        mock_handle_restaurant.assert_called_once_with("I want to book a restaurant", "test_session", "en")
+        chat_deps["handle_restaurant_dialog"].assert_called_once_with("I want to book a restaurant", "test_session", "en")
 
-    @pytest.mark.asyncio
-    async def test_process_request_async_with_rag_results(self, mocker):
-        """Test the process_request_async method with RAG results."""
-        # Mock dependencies
-        mocker.patch("app.services.chat_service.track_session")
-        mocker.patch("app.services.chat_service.analyze_sentiment", return_value="Positive")
-        mocker.patch("app.services.chat_service.detect_language", return_value="en")
-        mocker.patch("app.services.chat_service.contains_restaurant_trigger", return_value=False)
-        mocker.patch("app.services.chat_service.extract_required_features", return_value={})
-        
-        # Create mock RAG results
-        mock_rag_results = [
+    @pytest.mark.chat_deps(
+        query_places=_returns([
             {
                 "name": "Test Restaurant",
                 "category": "Restaurant",
@@ -112,12 +138,11 @@ class TestChatService:
                 "has_booking": True,
                 "email": "test@example.com"
             }
-        ]
-        mocker.patch("app.services.chat_service.query_places", return_value=mock_rag_results)
-        mocker.patch("app.services.chat_service.get_chatgpt_response", return_value="GPT response with RAG context")
-        mocker.patch("app.services.chat_service.get_proverb_by_sentiment", 
-                    return_value=("Catalan proverb", "English translation"))
-
+        ]),
+        get_chatgpt_response=_returns("GPT response with RAG context"),
+    )
+    async def test_process_request_async_with_rag_results(self, chat_deps):
+        """Test the process_request_async method with RAG results."""
         # Call the method
         result = await ChatService.process_request_async("Tell me about restaurants", "test_session")
 
@@ -127,21 +152,12 @@ class TestChatService:
         assert "Catalan proverb" in result["response"]
         assert "English translation" in result["response"]
 
-    @pytest.mark.asyncio
-    async def test_process_request_async_with_translation(self, mocker):
+    @pytest.mark.chat_deps(
+        detect_language=_returns("es"),
+        translate_text=_returns("Spanish translation"),
+    )
+    async def test_process_request_async_with_translation(self, chat_deps):
         """Test the process_request_async method with translation."""
-        # Mock dependencies
-        mocker.patch("app.services.chat_service.track_session")
-        mocker.patch("app.services.chat_service.analyze_sentiment", return_value="Positive")
-        mocker.patch("app.services.chat_service.detect_language", return_value="es")
-        mocker.patch("app.services.chat_service.contains_restaurant_trigger", return_value=False)
-        mocker.patch("app.services.chat_service.extract_required_features", return_value={})
-        mocker.patch("app.services.chat_service.query_places", return_value=[])
-        mocker.patch("app.services.chat_service.get_chatgpt_response", return_value="GPT response")
-        mocker.patch("app.services.chat_service.get_proverb_by_sentiment", 
-                    return_value=("Catalan proverb", "English translation"))
-        mocker.patch("app.services.chat_service.translate_text", return_value="Spanish translation")
-
         # Call the method
         result = await ChatService.process_request_async("Hola", "test_session")
 
@@ -152,12 +168,9 @@ class TestChatService:
         assert "Spanish translation" in result["response"]
         assert "Traducción" in result["response"]  # Spanish translation label
 
-    @pytest.mark.asyncio
-    async def test_process_request_async_error_handling(self, mocker):
+    @pytest.mark.chat_deps(track_session=_raises(Exception("Test error")))
+    async def test_process_request_async_error_handling(self, chat_deps):
         """Test the process_request_async method with error handling."""
-        # Mock dependencies to raise an exception
-        mocker.patch("app.services.chat_service.track_session", side_effect=Exception("Test error"))
-
         # Call the method
         result = await ChatService.process_request_async("Hello", "test_session")
 
@@ -165,7 +178,6 @@ class TestChatService:
         assert "response" in result
         assert "Meow... Something went wrong with my whiskers" in result["response"]
 
-    @pytest.mark.asyncio
     async def test_process_request_async_empty_input(self):
         """Test the process_request_async method with empty input."""
         # Call the method with empty input
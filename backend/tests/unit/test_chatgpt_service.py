@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import MagicMock, patch
+from openai import APITimeoutError, RateLimitError
 
 from app.services.chatgpt_service import get_chatgpt_response, response_cache
 
@@ -74,7 +75,7 @@ class TestChatGPTService:
         """Test handling of rate limit errors."""
         # Configure the mock to raise a rate limit error
         mock_client = mock_openai.return_value
-        mock_client.chat.completions.create.side_effect = Exception("RateLimitError")
+        mock_client.chat.completions.create.side_effect = RateLimitError("Rate limit reached", response=MagicMock(), body=None)
         
         # Configure the translate mock
         mock_translate.return_value = "Translated fallback"
@@ -91,7 +92,7 @@ class TestChatGPTService:
         """Test handling of timeout errors."""
         # Configure the mock to raise a timeout error
         mock_client = mock_openai.return_value
-        mock_client.chat.completions.create.side_effect = Exception("APITimeoutError")
+        mock_client.chat.completions.create.side_effect = APITimeoutError(request=MagicMock())
         
         # Configure the translate mock
         mock_translate.return_value = "Translated fallback"
@@ -1,38 +1,51 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import DEFAULT, patch, MagicMock
 import asyncio
+import sys
+import threading
+from types import SimpleNamespace
+from freezegun import freeze_time
 
 from app.services.restaurant_service import (
     extract_required_features,
     contains_restaurant_trigger,
     create_rag_response,
     load_restaurant_keywords,
-    handle_restaurant_dialog
+    handle_restaurant_dialog,
+    build_trigger_patterns
 )
 
+# Keyword tables patched into the service in place of the YAML-loaded ones
+_FEATURE_KW = {
+    "has_terrace": {
+        "en": ["terrace", "outdoor"],
+        "es": ["terraza", "exterior"]
+    },
+    "sea_view": {
+        "en": ["sea view", "ocean view"],
+        "es": ["vista al mar", "vista al océano"]
+    }
+}
+_RESTAURANT_KW = {
+    "en": ["restaurant", "cafe", "dining"],
+    "es": ["restaurante", "cafetería", "comida"]
+}
+# "cafe" is used in both English and Spanish
+_SHARED_RESTAURANT_KW = {
+    "en": ["restaurant", "cafe", "dining"],
+    "es": ["restaurante", "cafe", "comida"]
+}
+# Trigger patterns compiled from the keyword tables above
+_RESTAURANT_TRIGGERS = build_trigger_patterns(_RESTAURANT_KW)
+_SHARED_RESTAURANT_TRIGGERS = build_trigger_patterns(_SHARED_RESTAURANT_KW)
+
 @pytest.mark.unit
 class TestRestaurantService:
     """Tests for the restaurant_service module."""
 
-    @patch('app.services.restaurant_service.FEATURE_KEYWORDS')
-    def test_extract_required_features(self, mock_feature_keywords):
+    @patch.dict('app.services.restaurant_service.FEATURE_KEYWORDS', _FEATURE_KW, clear=True)
+    def test_extract_required_features(self):
         """Test extracting required features from user input."""
-        # Setup mock feature keywords
-        mock_feature_keywords.__getitem__.return_value = {
-            "en": ["terrace", "outdoor"],
-            "es": ["terraza", "exterior"]
-        }
-        mock_feature_keywords.items.return_value = [
-            ("has_terrace", {
-                "en": ["terrace", "outdoor"],
-                "es": ["terraza", "exterior"]
-            }),
-            ("sea_view", {
-                "en": ["sea view", "ocean view"],
-                "es": ["vista al mar", "vista al océano"]
-            })
-        ]
-
         # Test with English input
         user_input = "I want a restaurant with a terrace"
         result = extract_required_features(user_input, "en")
@@ -55,16 +68,9 @@ class TestRestaurantService:
         result = extract_required_features(user_input, "fr")
         assert result == {}
 
-    @patch('app.services.restaurant_service.RESTAURANT_KEYWORDS_BY_LANG')
-    def test_contains_restaurant_trigger(self, mock_keywords):
+    @patch.dict('app.services.restaurant_service.TRIGGER_PATTERNS', _RESTAURANT_TRIGGERS, clear=True)
+    def test_contains_restaurant_trigger(self):
         """Test checking if text contains restaurant-related triggers."""
-        # Setup mock keywords
-        mock_keywords.get.side_effect = lambda lang, default=None: {
-            "en": ["restaurant", "cafe", "dining"],
-            "es": ["restaurante", "cafetería", "comida"]
-        }.get(lang, [])
-        mock_keywords.__iter__.return_value = ["en", "es"]
-
         # Test with English input containing trigger
         text = "I want to find a restaurant"
         assert contains_restaurant_trigger(text, "en") is True
@@ -77,13 +83,9 @@ class TestRestaurantService:
         text = "I want to go to the beach"
         assert contains_restaurant_trigger(text, "en") is False
 
-        # Test with input containing trigger used in multiple languages
-        # Mock the behavior where "cafe" is used in both English and Spanish
-        mock_keywords.get.side_effect = lambda lang, default=None: {
-            "en": ["restaurant", "cafe", "dining"],
-            "es": ["restaurante", "cafe", "comida"]
-        }.get(lang, [])
-
+    @patch.dict('app.services.restaurant_service.TRIGGER_PATTERNS', _SHARED_RESTAURANT_TRIGGERS, clear=True)
+    def test_contains_restaurant_trigger_shared_keyword(self):
+        """Test that a keyword used in multiple languages is not a trigger."""
         text = "I want to go to a cafe"
         assert contains_restaurant_trigger(text, "en") is False  # Should be False because "cafe" is used in multiple languages
 
@@ -131,40 +133,50 @@ class TestRestaurantService:
         with pytest.raises(ValueError, match="rag_results must be a list"):
             create_rag_response("not a list")
 
-    @patch('app.services.restaurant_service.yaml')
-    @patch('app.services.restaurant_service.open')
-    def test_load_restaurant_keywords(self, mock_open, mock_yaml):
+    def test_load_restaurant_keywords(self):
         """Test loading restaurant keywords from a YAML file."""
-        # Setup mock yaml.safe_load to return a dictionary
-        mock_yaml.safe_load.return_value = {"keywords": {"en": ["restaurant", "cafe"]}}
-
-        # Test successful loading
-        result = load_restaurant_keywords()
-        assert result == {"en": ["restaurant", "cafe"]}
-        mock_open.assert_called_once()
-        mock_yaml.safe_load.assert_called_once()
-
-        # Test exception handling
-        mock_open.side_effect = Exception("Test exception")
-        result = load_restaurant_keywords()
-        assert result == {}
-
-    @pytest.mark.asyncio
-    @patch('app.services.restaurant_service.get_next_step')
-    async def test_handle_restaurant_dialog(self, mock_get_next_step):
+        with patch.multiple('app.services.restaurant_service', yaml=DEFAULT, open=DEFAULT, create=True) as mocks:
+            # Setup mock yaml.safe_load to return a dictionary
+            mocks["yaml"].safe_load.return_value = {"keywords": {"en": ["restaurant", "cafe"]}}
+
+            # Test successful loading
+            result = load_restaurant_keywords()
+            assert result == {"en": ["restaurant", "cafe"]}
+            mocks["open"].assert_called_once()
+            mocks["yaml"].safe_load.assert_called_once()
+
+            # Test exception handling
+            mocks["open"].side_effect = Exception("Test exception")
+            result = load_restaurant_keywords()
+            assert result == {}
+
+    async def test_handle_restaurant_dialog(self):
         """Test handling restaurant dialog."""
-        # Setup mock get_next_step
-        mock_get_next_step.return_value = "Restaurant response"
-
-        # Test successful handling
-        result = await handle_restaurant_dialog("I want to book a restaurant", "test_session", "en")
-        assert result == {"response": "Restaurant response"}
-        mock_get_next_step.assert_called_once_with("test_session", "en", "I want to book a restaurant")
-
-        # Test timeout
-        mock_get_next_step.side_effect = asyncio.TimeoutError("Test timeout")
-        result = await handle_restaurant_dialog("I want to book a restaurant", "test_session", "en")
-        assert "Sorry, the restaurant booking system is taking too long to respond" in result["response"]
+        # Setup a stand-in script engine; the service imports get_next_step lazily
+        mock_get_next_step = MagicMock(return_value="Restaurant response")
+        script_engine = SimpleNamespace(get_next_step=mock_get_next_step)
+
+        with patch.dict(sys.modules, {"restaurant_script_engine": script_engine}):
+            # Test successful handling
+            result = await handle_restaurant_dialog("I want to book a restaurant", "test_session", "en")
+            assert result == {"response": "Restaurant response"}
+            mock_get_next_step.assert_called_once_with("test_session", "en", "I want to book a restaurant")
+
+            # Test timeout: the engine blocks until released and the frozen clock
+            # is moved past the 5 second limit, so the real wait_for expires at once
+            release = threading.Event()
+            mock_get_next_step.side_effect = lambda *args: release.wait()
+
+            with freeze_time("2024-01-01") as frozen:
+                async def advance_clock():
+                    frozen.tick(delta=6)
+
+                asyncio.create_task(advance_clock())
+                try:
+                    result = await handle_restaurant_dialog("I want to book a restaurant", "test_session", "en")
+                finally:
+                    release.set()
+            assert "Sorry, the restaurant booking system is taking too long to respond" in result["response"]
 
         # Test import error
         with patch('app.services.restaurant_service.asyncio.wait_for', side_effect=ImportError("Test import error")):
@@ -1,37 +1,36 @@
 import pytest
 from unittest.mock import patch, MagicMock
 import pandas as pd
-from collections import deque
+from collections import OrderedDict
+from textblob import TextBlob
 
 from app.services.sentiment_service import (
     analyze_sentiment,
     get_proverb_by_sentiment,
-    load_proverbs_dataset,
-    RECENTLY_USED_PROVERBS
+    load_proverbs_dataset
 )
 
+@pytest.fixture(scope="session")
+def _warm_textblob():
+    """Run TextBlob once so its lazy analyzer setup isn't paid by the first test."""
+    TextBlob("warm").sentiment
+
 @pytest.mark.unit
 class TestSentimentService:
     """Tests for the sentiment_service module."""
 
-    def test_analyze_sentiment_positive(self):
-        """Test analyzing positive sentiment."""
-        text = "I love this product, it's amazing!"
-        result = analyze_sentiment(text)
-        assert result == "Positive"
-
-    def test_analyze_sentiment_negative(self):
-        """Test analyzing negative sentiment."""
-        text = "I hate this product, it's terrible!"
-        result = analyze_sentiment(text)
-        assert result == "Negative"
-
-    def test_analyze_sentiment_neutral(self):
-        """Test analyzing neutral sentiment."""
-        text = "This is a product."
-        result = analyze_sentiment(text)
-        assert result == "Neutral"
+    @pytest.mark.heavyimport
+    @pytest.mark.usefixtures("_warm_textblob")
+    @pytest.mark.parametrize("text,expected", [
+        ("I love this product, it's amazing!", "Positive"),
+        ("I hate this product, it's terrible!", "Negative"),
+        ("This is a product.", "Neutral"),
+    ], ids=["positive", "negative", "neutral"])
+    def test_analyze_sentiment(self, text, expected):
+        """Test analyzing positive, negative and neutral sentiment."""
+        assert analyze_sentiment(text) == expected
 
+    @pytest.mark.heavyimport
     @patch('app.services.sentiment_service.TextBlob')
     def test_analyze_sentiment_exception(self, mock_textblob):
         """Test handling of exceptions in sentiment analysis."""
@@ -41,38 +40,20 @@ class TestSentimentService:
         result = analyze_sentiment(text)
         assert result == "Neutral"  # Default to neutral on error
 
-    @patch('app.services.sentiment_service.PROVERBS_DF')
-    def test_get_proverb_by_sentiment_found(self, mock_df):
+    def test_get_proverb_by_sentiment_found(self, sample_proverbs_df):
         """Test getting a proverb by sentiment when proverbs are found."""
-        # Create a mock DataFrame with test data
-        mock_df.__bool__.return_value = True  # Make the DataFrame evaluate to True
-        mock_df.empty = False
-        
-        # Create a sample DataFrame
-        sample_data = {
-            'id': [1, 2, 3],
-            'Catalan Proverb': ['Proverb 1', 'Proverb 2', 'Proverb 3'],
-            'English Translation': ['Translation 1', 'Translation 2', 'Translation 3'],
-            'Sentiment': ['Positive', 'Negative', 'Neutral']
-        }
-        sample_df = pd.DataFrame(sample_data)
-        
-        # Mock the filtering and sampling operations
-        mock_df.__getitem__.return_value = MagicMock()
-        mock_df.__getitem__().eq.return_value = MagicMock()
-        mock_df[mock_df['Sentiment'].eq('Positive')] = sample_df[sample_df['Sentiment'] == 'Positive']
-        mock_df[~mock_df['id'].isin([])].empty = False
-        mock_df[~mock_df['id'].isin([])].sample.return_value = sample_df[sample_df['Sentiment'] == 'Positive']
-        
-        # Reset the recently used proverbs
-        global RECENTLY_USED_PROVERBS
-        RECENTLY_USED_PROVERBS = deque(maxlen=50)
-        
-        # Test getting a positive proverb
-        catalan, english = get_proverb_by_sentiment("Positive", "test input")
+        # Use the sample DataFrame with an empty recently used history
+        recently_used = OrderedDict()
+        with patch('app.services.sentiment_service.PROVERBS_DF', new=sample_proverbs_df), \
+                patch('app.services.sentiment_service.RECENTLY_USED_PROVERBS', new=recently_used):
+            # Test getting a positive proverb
+            catalan, english = get_proverb_by_sentiment("Positive", "test input")
         assert catalan == "Proverb 1"
         assert english == "Translation 1"
 
+        # Verify the proverb was tracked as recently used
+        assert list(recently_used) == [(1, "Positive")]
+
     @patch('app.services.sentiment_service.PROVERBS_DF')
     def test_get_proverb_by_sentiment_not_found(self, mock_df):
         """Test getting a proverb by sentiment when no proverbs are found."""
@@ -112,20 +93,16 @@ class TestSentimentService:
         assert catalan == "Fes bé i no facis mal, que altre sermó no et cal."
         assert english == "Do good and do no harm, for you need no other sermon."
 
+    @pytest.mark.heavyimport
     @patch('app.services.sentiment_service.pd.read_csv')
     @patch('app.services.sentiment_service.os.path.exists')
-    def test_load_proverbs_dataset_success(self, mock_exists, mock_read_csv):
+    def test_load_proverbs_dataset_success(self, mock_exists, mock_read_csv, sample_proverbs_df):
         """Test loading the proverbs dataset successfully."""
         # Mock os.path.exists to return True
         mock_exists.return_value = True
-        
-        # Create a mock DataFrame
-        mock_df = pd.DataFrame({
-            'Catalan Proverb': ['Proverb 1', 'Proverb 2'],
-            'English Translation': ['Translation 1', 'Translation 2'],
-            'Sentiment': ['Positive', 'Negative']
-        })
-        mock_read_csv.return_value = mock_df
+
+        # Loading cleans up columns in place, so hand it a copy of the shared frame
+        mock_read_csv.return_value = sample_proverbs_df.copy()
         
         # Call the function
         load_proverbs_dataset()
@@ -133,6 +110,7 @@ class TestSentimentService:
         # Verify that read_csv was called
         mock_read_csv.assert_called_once()
 
+    @pytest.mark.heavyimport
     @patch('app.services.sentiment_service.os.path.exists')
     def test_load_proverbs_dataset_file_not_found(self, mock_exists):
         """Test loading the proverbs dataset when the file is not found."""
@@ -144,6 +122,7 @@ class TestSentimentService:
         
         # No assertions needed, just checking that the function doesn't raise an exception
 
+    @pytest.mark.heavyimport
     @patch('app.services.sentiment_service.pd.read_csv')
     @patch('app.services.sentiment_service.os.path.exists')
     def test_load_proverbs_dataset_exception(self, mock_exists, mock_read_csv):
@@ -1,12 +1,33 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-from app.services.translation_service import translate_text, translation_cache, translator_pool
+from app.services.translation_service import translate_text
+
+@pytest.fixture
+def isolated_cache(monkeypatch):
+    """Give the test its own translation cache instead of the module-wide one."""
+    cache = {}
+    monkeypatch.setattr("app.services.translation_service.translation_cache", cache)
+    return cache
+
+@pytest.fixture
+def isolated_pool(monkeypatch):
+    """Give the test its own translator pool instead of the module-wide one."""
+    pool = {}
+    monkeypatch.setattr("app.services.translation_service.translator_pool", pool)
+    return pool
+
+@pytest.fixture(autouse=True)
+def prewarmed_pool(mock_translator, isolated_pool):
+    """Seed the test's translator pool with the mocked translator, so tests skip its creation."""
+    for pool_key in ("en-es", "en-fr"):
+        isolated_pool[pool_key] = mock_translator.return_value
+    return isolated_pool
 
 class TestTranslationService:
     """Tests for the Translation service."""
 
-    def test_translate_text_basic(self, mock_translator):
+    def test_translate_text_basic(self, mock_translator, isolated_cache):
         """Test the translate_text function with basic functionality."""
         # Call the function
         response = translate_text("Hello", "es")
@@ -14,13 +35,8 @@ class TestTranslationService:
         # Verify the response
         assert response == "Mocked translation"
         
-        # Verify the translator was called correctly
-        mock_translator.assert_called_once()
-        
-        # Verify the translator was initialized with the correct parameters
-        call_args = mock_translator.call_args[1]
-        assert call_args["source"] == "en"
-        assert call_args["target"] == "es"
+        # Verify the pooled translator was called correctly
+        mock_translator.return_value.translate.assert_called_once_with("Hello")
 
     def test_translate_text_no_translation_needed(self, mock_translator):
         """Test that no translation is performed when not needed."""
@@ -34,11 +50,8 @@ class TestTranslationService:
         assert response == "Hello"
         mock_translator.assert_not_called()
 
-    def test_translate_text_caching(self, mock_translator):
+    def test_translate_text_caching(self, mock_translator, isolated_cache):
         """Test that translations are cached."""
-        # Clear the cache
-        translation_cache.clear()
-        
         # Call the function twice with the same input
         response1 = translate_text("Hello", "es")
         response2 = translate_text("Hello", "es")
@@ -47,48 +60,44 @@ class TestTranslationService:
         assert response1 == response2
         
         # Verify the translator was called only once
-        assert mock_translator.call_count == 1
+        assert mock_translator.return_value.translate.call_count == 1
 
-    def test_translate_text_different_languages(self, mock_translator):
+    def test_translate_text_different_languages(self, mock_translator, isolated_cache):
         """Test that different languages use different cache keys."""
-        # Clear the cache
-        translation_cache.clear()
-        
         # Call the function with different target languages
         translate_text("Hello", "es")
         translate_text("Hello", "fr")
         
-        # Verify the translator was called twice
-        assert mock_translator.call_count == 2
-        
-        # Verify the translator was initialized with different target languages
-        call_args_list = mock_translator.call_args_list
-        assert call_args_list[0][1]["target"] == "es"
-        assert call_args_list[1][1]["target"] == "fr"
+        # Verify each language used its own pooled translator
+        assert mock_translator.return_value.translate.call_count == 2
+        mock_translator.assert_not_called()
 
-    def test_translate_text_translator_pool(self, mock_translator):
+    def test_translate_text_translator_pool(self, mock_translator, isolated_cache, isolated_pool):
         """Test that the translator pool is used."""
-        # Clear the pool
-        translator_pool.clear()
+        # Start from an empty pool
+        isolated_pool.clear()
         
         # Call the function
         translate_text("Hello", "es")
         
         # Verify the translator was added to the pool
-        assert "en-es" in translator_pool
+        assert "en-es" in isolated_pool
         
         # Call the function again with the same language
         translate_text("Different text", "es")
         
         # Verify the translator was called only once (for initialization)
         assert mock_translator.call_count == 1
+        
+        # Verify the translator was initialized with the correct parameters
+        call_args = mock_translator.call_args[1]
+        assert call_args["source"] == "en"
+        assert call_args["target"] == "es"
 
-    def test_translate_text_connection_error(self, mock_translator):
+    def test_translate_text_connection_error(self, mock_translator, isolated_cache):
         """Test handling of connection errors."""
-        # Configure the mock to raise a connection error
-        mock_instance = MagicMock()
-        mock_instance.translate.side_effect = ConnectionError("Connection error")
-        mock_translator.return_value = mock_instance
+        # Configure the pooled translator to raise a connection error
+        mock_translator.return_value.translate.side_effect = ConnectionError("Connection error")
         
         # Call the function
         response = translate_text("Hello", "es")
@@ -96,12 +105,10 @@ class TestTranslationService:
         # Verify the original text is returned
         assert response == "Hello"
 
-    def test_translate_text_timeout_error(self, mock_translator):
+    def test_translate_text_timeout_error(self, mock_translator, isolated_cache):
         """Test handling of timeout errors."""
-        # Configure the mock to raise a timeout error
-        mock_instance = MagicMock()
-        mock_instance.translate.side_effect = TimeoutError("Timeout error")
-        mock_translator.return_value = mock_instance
+        # Configure the pooled translator to raise a timeout error
+        mock_translator.return_value.translate.side_effect = TimeoutError("Timeout error")
         
         # Call the function
         response = translate_text("Hello", "es")
@@ -109,12 +116,10 @@ class TestTranslationService:
         # Verify the original text is returned
         assert response == "Hello"
 
-    def test_translate_text_general_error(self, mock_translator):
+    def test_translate_text_general_error(self, mock_translator, isolated_cache):
         """Test handling of general errors."""
-        # Configure the mock to raise a general error
-        mock_instance = MagicMock()
-        mock_instance.translate.side_effect = Exception("General error")
-        mock_translator.return_value = mock_instance
+        # Configure the pooled translator to raise a general error
+        mock_translator.return_value.translate.side_effect = Exception("General error")
         
         # Call the function
         response = translate_text("Hello", "es")
@@ -123,11 +128,8 @@ class TestTranslationService:
         assert response == "Hello"
 
     @patch("app.services.translation_service.log_metric")
-    def test_translate_text_metrics(self, mock_log_metric, mock_translator):
+    def test_translate_text_metrics(self, mock_log_metric, mock_translator, isolated_cache):
         """Test that metrics are logged."""
-        # Clear the cache
-        translation_cache.clear()
-        
         # Call the function
         translate_text("Hello", "es")
         